@@ -4,6 +4,7 @@ from wtforms.validators import DataRequired, Optional, ValidationError
 from flask_wtf.file import FileAllowed
 import logging
 from app.models import City
+from app.importers import IMPORT_EXTENSIONS
 
 # Initialize logging
 logger = logging.getLogger(__name__)
@@ -52,9 +53,9 @@ class SubmissionForm(FlaskForm):
     submit = SubmitField('Submit')
 
 class UploadForm(FlaskForm):
-    """Form for uploading city data via an Excel file."""
+    """Form for uploading city data via an Excel, CSV or Parquet file."""
     city_name = StringField('City Name', validators=[DataRequired()])
-    excel_file = FileField('Excel File', validators=[DataRequired(), FileAllowed(['xlsx', 'xls'], 'Excel files only!')])
+    excel_file = FileField('Data File', validators=[DataRequired(), FileAllowed(list(IMPORT_EXTENSIONS), 'Excel, CSV or Parquet files only!')])
     submit = SubmitField('Upload')
 
     def validate_city_name(self, field):
@@ -0,0 +1,109 @@
+import csv
+import os
+import logging
+
+# Initialize logging
+logger = logging.getLogger(__name__)
+
+# Columns every city import file must provide
+REQUIRED_COLUMNS = ('Address', 'Owner')
+
+# File extensions accepted by import_data
+IMPORT_EXTENSIONS = ('xlsx', 'xls', 'csv', 'parquet')
+
+MISSING_VALUE = "Unknown"
+
+# Cell values (after trimming whitespace) treated as missing in every format;
+# a superset of pandas' default NA strings so Excel imports keep their old behaviour
+MISSING_MARKERS = (
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+)
+
+# Tried in order; cp1252 covers Windows Excel "CSV (Comma delimited)" exports
+CSV_ENCODINGS = ('utf-8-sig', 'cp1252')
+
+
+def _check_columns(columns):
+    """Raise a ValueError if any of the required columns is absent."""
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+
+def _fill_missing(values):
+    """Replace missing markers in a column of strings with MISSING_VALUE."""
+    return [MISSING_VALUE if value.strip() in MISSING_MARKERS else value for value in values]
+
+
+def _read_excel(file_path):
+    """Read the required columns from an Excel workbook via pandas."""
+    import pandas as pd
+
+    # Let pandas pick the engine by extension: openpyxl for xlsx, xlrd for xls
+    df = pd.read_excel(file_path, dtype=str, keep_default_na=False)
+    _check_columns(df.columns)
+    return [_fill_missing(df[name].tolist()) for name in REQUIRED_COLUMNS]
+
+
+def _read_csv_columns(file_path, encoding):
+    """Stream the required columns out of a CSV file with the stdlib reader."""
+    with open(file_path, newline='', encoding=encoding) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        _check_columns(header)
+        indexes = [header.index(name) for name in REQUIRED_COLUMNS]
+        records = [record for record in reader if record]
+
+    return [
+        _fill_missing([record[idx] if idx < len(record) else '' for record in records])
+        for idx in indexes
+    ]
+
+
+def _read_csv(file_path):
+    """Read a CSV file, falling back through CSV_ENCODINGS on decode errors."""
+    for encoding in CSV_ENCODINGS:
+        try:
+            return _read_csv_columns(file_path, encoding)
+        except UnicodeDecodeError:
+            logger.warning(f"Could not decode {file_path} as {encoding}")
+    raise ValueError(f"CSV file must be encoded as one of: {', '.join(CSV_ENCODINGS)}")
+
+
+def _read_parquet(file_path):
+    """Read only the required columns from a Parquet file with pyarrow."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    _check_columns(pq.read_schema(file_path).names)
+    table = pq.read_table(file_path, columns=list(REQUIRED_COLUMNS))
+
+    markers = pa.array(MISSING_MARKERS, type=pa.string())
+    columns = []
+    for name in REQUIRED_COLUMNS:
+        column = pc.fill_null(pc.cast(table.column(name), pa.string()), '')
+        is_missing = pc.is_in(pc.utf8_trim_whitespace(column), value_set=markers)
+        columns.append(pc.if_else(is_missing, MISSING_VALUE, column).to_pylist())
+    return columns
+
+
+_READERS = {
+    'xlsx': _read_excel,
+    'xls': _read_excel,
+    'csv': _read_csv,
+    'parquet': _read_parquet,
+}
+
+
+def read_address_rows(file_path):
+    """Return (address, owner) pairs from an import file, dispatching on its extension."""
+    ext = os.path.splitext(file_path)[1].lstrip('.').lower()
+    reader = _READERS.get(ext)
+    if reader is None:
+        raise ValueError(f"Unsupported import file type: .{ext}")
+    addresses, owners = reader(file_path)
+    logger.info(f"Read {len(addresses)} rows from {file_path}")
+    return list(zip(addresses, owners))
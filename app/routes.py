@@ -1,9 +1,9 @@
 from flask import Blueprint, current_app, jsonify, request, send_file, send_from_directory, make_response, redirect, url_for, flash, render_template
 from werkzeug.utils import secure_filename
-import pandas as pd
 from app import db
 from app.models import City, Address, Submission
 from app.forms import SubmissionForm, UploadForm
+from app.importers import read_address_rows
 import qrcode
 import os
 import io
@@ -39,8 +39,7 @@ def generate_qr_code(data, filename):
     return img_path  # Return just the filename, not the full path
 
 def import_data(file_path, city_name):
-    df = pd.read_excel(file_path, engine='openpyxl')
-    df.fillna("Unknown", inplace=True)
+    rows = read_address_rows(file_path)
 
     city = City.query.filter_by(name=city_name).first()
     if not city:
@@ -54,9 +53,7 @@ def import_data(file_path, city_name):
 
     pdf.set_font('TWCenMT', '', 12)
 
-    for index, row in df.iterrows():
-        address = row['Address']
-        owner_name = row['Owner']
+    for address, owner_name in rows:
         
         unique_token = os.urandom(8).hex()
         
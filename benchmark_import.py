@@ -0,0 +1,86 @@
+import os
+import tempfile
+import time
+import logging
+
+import pandas as pd
+
+from app.importers import read_address_rows
+
+ROW_COUNT = 100_000
+REPEATS = 3
+
+
+def build_frame(row_count):
+    """Build a synthetic city import with some blank and missing-marker cells."""
+    def owner(i):
+        if i % 50 == 0:
+            return None
+        if i % 75 == 0:
+            return 'N/A'
+        if i % 80 == 0:
+            return '#N/A'
+        if i % 85 == 0:
+            return 'n/a'
+        return f"Owner {i}"
+
+    return pd.DataFrame({
+        'Address': ['' if i % 90 == 0 else f"{i} Main St" for i in range(row_count)],
+        'Owner': [owner(i) for i in range(row_count)],
+    })
+
+
+def read_baseline_rows(file_path):
+    """Return (address, owner) pairs the way import_data read Excel before the fast path."""
+    df = pd.read_excel(file_path, engine='openpyxl').fillna("Unknown")
+    return list(zip(df['Address'].tolist(), df['Owner'].tolist()))
+
+
+def time_reader(file_path):
+    """Return the parsed rows and the best parse time in seconds over REPEATS runs."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        rows = read_address_rows(file_path)
+        best = min(best, time.perf_counter() - start)
+    return rows, best
+
+
+def main():
+    df = build_frame(ROW_COUNT)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {
+            'xlsx': os.path.join(tmp_dir, 'city.xlsx'),
+            'csv': os.path.join(tmp_dir, 'city.csv'),
+            'parquet': os.path.join(tmp_dir, 'city.parquet'),
+        }
+        df.to_excel(paths['xlsx'], index=False, engine='openpyxl')
+        df.to_csv(paths['csv'], index=False)
+        df.to_parquet(paths['parquet'], index=False, engine='pyarrow')
+
+        # Keep per-read logging out of the results table
+        logging.getLogger('app.importers').setLevel(logging.WARNING)
+
+        results = {}
+        parsed = {}
+        for ext, path in paths.items():
+            parsed[ext], results[ext] = time_reader(path)
+        expected = read_baseline_rows(paths['xlsx'])
+
+    # Every format must map the same frame to the pairs the old Excel import produced
+    assert len(expected) == ROW_COUNT
+    assert expected[0] == ('Unknown', 'Unknown')
+    assert expected[75] == ('75 Main St', 'Unknown')
+    assert expected[80] == ('80 Main St', 'Unknown')
+    assert expected[85] == ('85 Main St', 'Unknown')
+    for ext, rows in parsed.items():
+        assert rows == expected, f"{ext} rows differ from the baseline Excel import"
+
+    print(f"Parse time for {ROW_COUNT} rows (best of {REPEATS}):")
+    for ext, seconds in results.items():
+        speedup = results['xlsx'] / seconds
+        print(f"  {ext:<8} {seconds:8.3f}s  {speedup:6.1f}x vs xlsx")
+
+
+if __name__ == '__main__':
+    main()